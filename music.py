@@ -1,20 +1,43 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
 import numpy as np
-import threading
-import time # Import time for pauses
-from collections import defaultdict
 
 # For audio - you'll need to install: pip install pygame
 try:
     import pygame
-    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+    pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=2048)
+    # Room for all 12 looping pitch classes plus chord previews (pygame defaults to 8)
+    pygame.mixer.set_num_channels(16)
     AUDIO_AVAILABLE = True
 except ImportError:
     print("Warning: pygame not available. Install with: pip install pygame")
     AUDIO_AVAILABLE = False
 
+# Hexagon hue wheel, indexed by a pitch class's position on the circle of fifths
+PITCH_COLORS = plt.cm.hsv(np.linspace(0, 1, 12))
+
+# Harmonic partials shared by every synthesized tone: (multiple of fundamental, amplitude)
+HARMONIC_MULTS = np.array([1, 2, 3, 4])
+HARMONIC_AMPS = np.array([1.0, 0.5, 0.3, 0.2])
+
+def harmonic_tone(cycles):
+    """Mix the harmonic partials for a fundamental phase given in cycles (1.0 = one period)"""
+    # Reduce to a single period, then build each sin(k*theta) from the fundamental with
+    # sin((k+1)x) = 2cos(x)sin(kx) - sin((k-1)x) instead of one np.sin pass per harmonic
+    theta = 2 * np.pi * (cycles % 1.0)
+    two_cos = 2 * np.cos(theta)
+    prev, current = np.zeros_like(theta), np.sin(theta)
+    
+    amps = dict(zip(HARMONIC_MULTS.tolist(), HARMONIC_AMPS.tolist()))
+    mono = np.zeros_like(theta)
+    for k in range(1, max(amps) + 1):
+        if k in amps:
+            mono += amps[k] * current
+        prev, current = current, two_cos * current - prev
+    return mono / len(HARMONIC_MULTS)
+
 class TonnetzGrid:
     def __init__(self, rows=7, cols=12):
         """
@@ -26,6 +49,10 @@ class TonnetzGrid:
         self.rows = rows
         self.cols = cols
         
+        # Every hexagon is the same shape, so its unit corners are computed once
+        angles = np.linspace(0, 2*np.pi, 7)
+        self._corner_template = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        
         # Musical constants
         self.pitch_classes = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
         self.enharmonics = {
@@ -47,150 +74,92 @@ class TonnetzGrid:
         # Audio system for continuous playback
         self.playing_notes = {}  # note -> pygame.mixer.Channel
         self.note_sounds = {}    # note -> pygame.mixer.Sound
-        self.audio_lock = threading.Lock()
+        self.chord_sounds = {}  # (root, quality) -> pre-mixed arpeggio pygame.mixer.Sound
         
         # Initialize the plot elements
         self.fig, self.ax = plt.subplots(figsize=(14, 10))
-        self.hexagons = {}
-        self.note_positions = defaultdict(list)  # Note can appear multiple times
-        self.active_notes = set()  # Currently active (toggled on) notes
-        self.chord_highlights = set()  # Notes highlighted by chord selection
+        self.hex_collection = None  # PolyCollection holding every hexagon
+        self.hex_labels = []  # Note name Text artists, one per hexagon
+        self._bg = None  # Axes background (without the hexagon layer) for blitting
         self.chord_triangles = []
         
+        # Per-hexagon state as parallel arrays, one row per hexagon (populated by create_hexagons)
+        self.hex_index = {}  # (row, col) -> hexagon index
+        self.hex_cells = np.empty((0, 2), dtype=int)  # (row, col) of each hexagon
+        self.hex_positions = np.empty((0, 2))  # Center (x, y) in axes coordinates
+        self.hex_pitch = np.empty(0, dtype=np.int8)  # Pitch class index
+        self.hex_base_color = np.empty((0, 4))  # RGBA color when idle
+        self.hex_facecolors = np.empty((0, 4))  # RGBA face color currently shown
+        self.hex_edgecolors = np.empty((0, 4))  # RGBA edge color currently shown
+        self.hex_active = np.empty(0, dtype=bool)  # Toggled on by the user
+        self.hex_highlighted = np.empty(0, dtype=bool)  # Part of the highlighted chord
+        
         # Mouse dragging state
         self.is_dragging = False
         self.drag_toggle_state = None  # True = turning on, False = turning off
         self.already_toggled = set()  # Track which hexes were toggled in current drag
         
-        # Tonnetz grid storage (will be populated later after sounds are ready)
-        self.grid = {}  # (row, col) -> pitch class
-        
-        # Loading screen elements
-        self.loading_text = None
-        self.loading_symbol = None
-        self.loading_messages = [
-            "♪ Generating 60 seconds of pure musical bliss per note...",
-            "♫ Teaching AI to sing in 12 different keys...", 
-            "♪ Calculating the optimal sine wave curves...",
-            "♫ Warming up the virtual vocal cords...",
-            "♪ Tuning the mathematical guitars...",
-            "♫ Loading piano keys from the cloud...",
-            "♪ Inflating digital brass instruments...",
-            "♫ Synchronizing quantum drum beats...",
-            "♪ Stretching virtual violin strings...",
-            "♫ Buffering the frequency spectrum...",
-            "♪ Downloading more cowbell...",
-            "♫ Converting coffee into audio waves..."
-        ]
-        self.current_message_idx = 0
-
-        # Flag to indicate when pre-generation is complete
-        self.sounds_pregenerated_event = threading.Event()
-
-        # Call show_loading_screen first thing to ensure it gets drawn
-        self.show_loading_screen()
-        # Force a draw and flush events to make sure the loading screen appears immediately
-        self.fig.canvas.draw()
-        self.fig.canvas.flush_events()
-        
-        # Start the sound pre-generation in a separate thread
-        # This allows the main thread to remain responsive for GUI updates (like the loading screen)
-        threading.Thread(target=self._run_pregeneration_task, daemon=True).start()
-
-    def _run_pregeneration_task(self):
-        """
-        This method is run in a separate thread to perform the long-running
-        sound pre-generation and then signal completion to the main thread.
-        """
-        print("Starting sound pre-generation...")
+        # Tonnetz grid storage (populated by create_tonnetz_grid)
+        self.grid_array = np.zeros((rows, cols), dtype=np.int8)  # [row, col] -> pitch class
+        
+        # Synthesis takes milliseconds, so everything is built up front on the main thread
         self.pregenerate_sounds()
-        print("Sound pre-generation complete.")
-        # Set the event to signal that sounds are ready
-        self.sounds_pregenerated_event.set()
+        self.create_tonnetz_grid()
+        self.setup_plot()
+        self.create_hexagons()
+    
+    def pregenerate_sounds(self, sample_rate=22050):
+        """Pre-generate a short seamless loop for each note"""
+        if not AUDIO_AVAILABLE:
+            return
         
-        # After sounds are ready, schedule the main grid creation and hiding of loading screen
-        # Use a simple lambda that takes no arguments and calls the setup method.
-        self.fig.canvas.get_tk_widget().after_idle(self._post_generation_setup)
+        # All 12 octave-4 tones are synthesized together as one (notes, frames) matrix,
+        # padded to the longest loop and sliced back to each note's own length
+        freqs = [self.note_frequencies[f"{note}4"] for note in self.pitch_classes]
+        loops = [self.loop_length(freq, sample_rate) for freq in freqs]
+        cycles = np.array([c for c, _ in loops])
+        frames = np.array([f for _, f in loops])
         
-    def _post_generation_setup(self):
-        """
-        This method is called on the main GUI thread after sounds are pre-generated.
-        It creates the main Tonnetz grid and hides the loading screen.
-        """
-        if not self.sounds_pregenerated_event.is_set():
-            return
-            
-        print("Performing post-generation setup (creating grid, hiding loading screen)...")
-        # Create the main Tonnetz grid data structure
-        self.create_tonnetz_grid()
+        n = np.arange(frames.max())
+        mono = harmonic_tone((cycles / frames)[:, None] * n)
+        samples = np.clip(mono * 15000, -32767, 32767).astype(np.int16)
         
-        # Hide the loading screen. This will also clear the axes and call create_hexagons.
-        self.hide_loading_screen()
-        print("Post-generation setup complete.")
-
-    def show_loading_screen(self):
-        """Show a simple loading screen"""
-        self.ax.clear()
-        self.ax.set_facecolor('#1a1a1a')
-        self.ax.set_aspect('equal')
+        for note, row, note_frames in zip(self.pitch_classes, samples, frames):
+            try:
+                self.note_sounds[note] = pygame.sndarray.make_sound(row[:note_frames])
+            except Exception as e:
+                print(f"Error creating sound for {note}: {e}")
         
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        for spine in self.ax.spines.values():
-            spine.set_visible(False)
-        
-        self.ax.set_xlim(-2, 2)
-        self.ax.set_ylim(-2, 2)
-        
-        # Add main loading text
-        self.loading_text = self.ax.text(0, 0.5, self.loading_messages[0], 
-                                       ha='center', va='center', 
-                                       fontsize=14, color='white', 
-                                       bbox=dict(boxstyle="round,pad=0.5", 
-                                               facecolor='purple', alpha=0.8))
-        
-        # Add simple music symbol
-        self.loading_symbol = self.ax.text(0, -0.5, "♪ ♫ ♪", ha='center', va='center',
-                                         fontsize=40, color='gold')
-        
-        # Add title using simple symbols
-        self.ax.text(0, 1.5, "♪ LOADING MUSICAL UNIVERSE ♪", 
-                    ha='center', va='center', fontsize=16, 
-                    color='cyan', fontweight='bold')
+        # Every chord reachable from the keyboard is mixed here, so a key press never synthesizes audio
+        previews = self.generate_preview_tone(np.array(freqs), sample_rate=sample_rate)
+        for root in ['C', 'D', 'E', 'F', 'G', 'A', 'B']:
+            for quality in ['major', 'minor']:
+                tones = previews[self.chord_indices(root, quality)]
+                try:
+                    self.chord_sounds[(root, quality)] = pygame.sndarray.make_sound(
+                        self.mix_arpeggio(tones, sample_rate=sample_rate))
+                except Exception as e:
+                    print(f"Error creating chord sound for {root} {quality}: {e}")
     
-    def hide_loading_screen(self):
-        """Hide the loading screen and restore the normal view"""
-        # Clear loading elements
-        if self.loading_text:
-            self.loading_text.remove()
-        if self.loading_symbol:
-            self.loading_symbol.remove()
-        self.loading_text = None
-        self.loading_symbol = None
-        
-        # Restore the normal plot by clearing and re-drawing the main elements
-        self.ax.clear()
-        self.setup_plot() # Setup the main plot title and styling
-        self.create_hexagons() # Re-add all hexagon patches and labels
-        self.fig.canvas.draw() # Final draw for the main content
-        self.fig.canvas.flush_events() # Flush events for the final display
+    def mix_arpeggio(self, tones, spacing=0.2, sample_rate=22050):
+        """Mix the tones into one buffer, each starting spacing seconds after the last"""
+        offset = int(spacing * sample_rate)
+        mix = np.zeros(offset * (len(tones) - 1) + tones.shape[1])
+        for i, tone in enumerate(tones):
+            mix[i * offset:i * offset + len(tone)] += tone
+        
+        return np.clip(mix, -32767, 32767).astype(np.int16)
     
-    def pregenerate_sounds(self):
-        """Pre-generate long sound loops for each note (long-running task)"""
-        if not AUDIO_AVAILABLE:
-            return
-            
-        for note in self.pitch_classes:
-            note_key = f"{note}4"  # Use octave 4
-            if note_key in self.note_frequencies:
-                frequency = self.note_frequencies[note_key]
-                audio_data = self.generate_long_tone(frequency, duration=60.0)
-                if audio_data is not None:
-                    try:
-                        sound = pygame.sndarray.make_sound(audio_data)
-                        self.note_sounds[note] = sound
-                    except Exception as e:
-                        print(f"Error creating sound for {note}: {e}")
+    def loop_length(self, frequency, sample_rate=22050, min_duration=0.25):
+        """Return (cycles, frames) for a loop holding a whole number of periods.
+        
+        The buffer is rounded to whole frames and the tone is synthesized at
+        cycles / frames per sample, so the loop wraps without a click. Every
+        harmonic is an integer multiple of the fundamental and wraps as well.
+        """
+        cycles = int(np.ceil(frequency * min_duration))
+        frames = int(round(sample_rate * cycles / frequency))
+        return cycles, frames
     
     def pitch_class_to_index(self, note):
         """Convert note name to pitch class index (0-11)"""
@@ -213,32 +182,18 @@ class TonnetzGrid:
         # Start with C in the middle
         start_row = self.rows // 2
         start_col = self.cols // 2
-        self.grid[(start_row, start_col)] = 0  # C
         
-        # Build the grid based on Tonnetz relationships
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if row == start_row and col == start_col:
-                    continue
-                    
-                # Calculate pitch class based on position
-                row_offset = row - start_row
-                col_offset = col - start_col
-                
-                if col % 2 == 0:  # Even columns
-                    pitch_index = (7 * col_offset + 4 * row_offset) % 12
-                else:  # Odd columns are offset down
-                    pitch_index = (7 * col_offset + 4 * (row_offset - 0.5)) % 12
-                    pitch_index = int(pitch_index) % 12
-                
-                self.grid[(row, col)] = pitch_index
-    
-    def hex_corners(self, x, y, size=0.5):
-        """Calculate pointy-topped hexagon corners"""
-        angles = np.linspace(0, 2*np.pi, 7)
-        corners_x = x + size * np.cos(angles)
-        corners_y = y + size * np.sin(angles)
-        return list(zip(corners_x, corners_y))
+        # Pitch class is a closed-form function of position, so compute it for the whole grid at once
+        rows_idx, cols_idx = np.meshgrid(np.arange(self.rows), np.arange(self.cols), indexing='ij')
+        row_offset = rows_idx - start_row
+        col_offset = cols_idx - start_col
+        
+        # Odd columns are offset down by half a row, i.e. 4 * -0.5 = -2 semitones
+        pitch = np.where(cols_idx % 2 == 0,
+                         7 * col_offset + 4 * row_offset,
+                         7 * col_offset + 4 * row_offset - 2) % 12
+        self.grid_array = pitch.astype(np.int8)
+        self.grid_array[start_row, start_col] = 0  # C, even when the center column is odd
     
     def setup_plot(self):
         """Setup the matplotlib plot for the main grid display"""
@@ -267,85 +222,117 @@ class TonnetzGrid:
         """Create hexagonal grid with PERFECT tessellation for pointy-topped hexagons"""
         hex_size = 0.5
 
-        self.hexagons = {}
-        self.note_positions.clear()
+        self.hex_labels = []
 
         h_spacing = hex_size * np.sqrt(3) * 0.93
         v_spacing = hex_size * 1.7
         
-        for (row, col), pitch_index in self.grid.items():
-            x = col * h_spacing
-            y = row * v_spacing
-            
-            if col % 2 == 1:
-                y += v_spacing / 2
-            
-            note = self.index_to_pitch_class(pitch_index)
-            
-            colors = plt.cm.hsv(np.linspace(0, 1, 12))
-            color_index = (pitch_index * 7) % 12
-            base_color = colors[color_index]
-            
-            corners = self.hex_corners(x, y, hex_size)
-            hex_patch = patches.Polygon(corners, closed=True, 
-                                      facecolor=base_color, 
-                                      edgecolor='white', 
-                                      linewidth=2, 
-                                      alpha=0.6,
-                                      picker=True)
-            
-            self.ax.add_patch(hex_patch)
-            self.hexagons[(row, col)] = {
-                'patch': hex_patch, 
-                'note': note, 
-                'pitch_index': pitch_index,
-                'position': (x, y),
-                'base_color': base_color,
-                'active': False
-            }
-            self.note_positions[note].append((row, col))
-            
-            self.ax.text(x, y, note, ha='center', va='center', 
-                        fontsize=14, fontweight='bold', color='white',
-                        bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.5))
+        # One hexagon per grid cell, row-major but with the center C first so that
+        # equally short chord triangles resolve towards the middle of the grid
+        count = self.rows * self.cols
+        center = (self.rows // 2) * self.cols + self.cols // 2
+        order = np.concatenate([[center], np.delete(np.arange(count), center)])
+        rows_idx, cols_idx = np.divmod(order, self.cols)
+        
+        self.hex_cells = np.stack([rows_idx, cols_idx], axis=1)
+        self.hex_index = {(int(row), int(col)): index
+                          for index, (row, col) in enumerate(self.hex_cells)}
+        self.hex_pitch = self.grid_array[rows_idx, cols_idx]
+        
+        # Odd columns sit half a row higher
+        self.hex_positions = np.stack([cols_idx * h_spacing,
+                                       rows_idx * v_spacing + (cols_idx % 2) * (v_spacing / 2)], axis=1)
+        
+        # Base color of every hexagon in one gather from the shared colormap
+        self.hex_base_color = PITCH_COLORS[(self.hex_pitch.astype(int) * 7) % 12]
+        
+        self.hex_active = np.zeros(count, dtype=bool)
+        self.hex_highlighted = np.zeros(count, dtype=bool)
+        
+        for (x, y), pitch_index in zip(self.hex_positions, self.hex_pitch):
+            label = self.ax.text(x, y, self.index_to_pitch_class(pitch_index), ha='center', va='center', 
+                                fontsize=14, fontweight='bold', color='white',
+                                bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.5),
+                                animated=True)
+            self.hex_labels.append(label)
+        
+        # Corners of every hexagon in one broadcast: (N, 7, 2)
+        verts = hex_size * self._corner_template[None] + self.hex_positions[:, None, :]
+        
+        # All hexagons live in one PolyCollection; each one's color is a row of these arrays
+        self.hex_facecolors = self.hex_base_color.copy()
+        self.hex_facecolors[:, 3] = 0.6
+        self.hex_edgecolors = np.tile(to_rgba('white', 0.6), (count, 1))
+        self.hex_collection = PolyCollection(verts,
+                                             facecolors=self.hex_facecolors,
+                                             edgecolors=self.hex_edgecolors,
+                                             linewidths=2,
+                                             picker=True,
+                                             animated=True)
+        self.ax.add_collection(self.hex_collection)
         
-        x_coords = [h['position'][0] for h in self.hexagons.values()]
-        y_coords = [h['position'][1] for h in self.hexagons.values()]
         padding = 1
-        self.ax.set_xlim(min(x_coords) - padding, max(x_coords) + padding)
-        self.ax.set_ylim(min(y_coords) - padding, max(y_coords) + padding)
-
-        self.update_active_notes_display()
+        x_min, y_min = self.hex_positions.min(axis=0)
+        x_max, y_max = self.hex_positions.max(axis=0)
+        self.ax.set_xlim(x_min - padding, x_max + padding)
+        self.ax.set_ylim(y_min - padding, y_max + padding)
     
-    def generate_long_tone(self, frequency, duration=60.0, sample_rate=22050):
-        """Generate a long sine wave tone with harmonics for seamless looping"""
-        if not AUDIO_AVAILABLE:
-            return None
-            
+    def set_hex_colors(self, which, color, alpha):
+        """Recolor hexagons selected by index, index array or mask; takes effect on the next refresh_hex_colors()
+        
+        color is either a single matplotlib color or an RGBA array with one row per selected hexagon.
+        """
+        rgba = np.asarray(to_rgba(color) if isinstance(color, str) else color)
+        self.hex_facecolors[which, :3] = rgba[..., :3]
+        self.hex_facecolors[which, 3] = alpha
+        self.hex_edgecolors[which, 3] = alpha
+    
+    def draw_hex_layer(self):
+        """Draw the animated hexagon layer (cells, chord triangles, labels) onto the canvas"""
+        self.ax.draw_artist(self.hex_collection)
+        for triangle in self.chord_triangles:
+            self.ax.draw_artist(triangle)
+        for label in self.hex_labels:
+            self.ax.draw_artist(label)
+    
+    def blit_hexagons(self):
+        """Repaint only the hexagon layer over the cached background"""
+        if self._bg is None or not self.fig.canvas.supports_blit:
+            self.fig.canvas.draw_idle()
+            return
+        self.fig.canvas.restore_region(self._bg)
+        self.draw_hex_layer()
+        self.fig.canvas.blit(self.ax.bbox)
+    
+    def on_draw(self, event):
+        """After a full redraw, cache the background and paint the hexagon layer on top"""
+        # When saving, the figure already rendered the animated artists itself
+        if self.hex_collection is None or self.fig.canvas.is_saving():
+            return
+        if self.fig.canvas.supports_blit:
+            self._bg = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_hex_layer()
+    
+    def refresh_hex_colors(self):
+        """Push the per-hexagon color arrays to the collection"""
+        self.hex_collection.set_facecolor(self.hex_facecolors)
+        self.hex_collection.set_edgecolor(self.hex_edgecolors)
+    
+    def generate_preview_tone(self, frequency, duration=1.5, sample_rate=22050):
+        """Generate a short tone with harmonics that fades out to silence
+        
+        frequency may also be an array, giving one tone per entry along a new last axis.
+        """
         frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        t = np.arange(frames) / sample_rate
         
-        harmonics = [(1.0, 1), (0.5, 2), (0.3, 3), (0.2, 4)]
+        mono = harmonic_tone(np.asarray(frequency)[..., None] * t)
         
-        for i in range(frames):
-            sample = 0
-            for amp, mult in harmonics:
-                sample += amp * np.sin(2 * np.pi * frequency * mult * i / sample_rate)
-            sample /= len(harmonics)
-            
-            arr[i][0] = sample
-            arr[i][1] = sample
+        # Linear fade-out over the last 0.3s (last frame reaches silence)
+        fade_frames = int(0.3 * sample_rate)
+        mono[..., -fade_frames:] *= np.arange(fade_frames)[::-1] / fade_frames
         
-        arr = np.clip(arr * 15000, -32767, 32767).astype(np.int16)
-        return arr
-    
-    def update_active_notes_display(self):
-        """Ensures that the visual state of active notes is correctly restored after a redraw."""
-        for (row, col) in self.active_notes:
-            if (row, col) in self.hexagons:
-                hex_data = self.hexagons[(row, col)]
-                hex_data['patch'].set_facecolor('white')
-                hex_data['patch'].set_alpha(1.0)
+        return np.clip(mono * 15000, -32767, 32767).astype(np.int16)
     
     def start_continuous_note(self, note):
         """Start playing a note continuously using long sample loop"""
@@ -353,181 +340,144 @@ class TonnetzGrid:
             print(f"Playing note: {note}")
             return
             
-        with self.audio_lock:
-            if note not in self.playing_notes:
-                try:
-                    channel = pygame.mixer.find_channel()
-                    if channel:
-                        channel.play(self.note_sounds[note], loops=-1)
-                        self.playing_notes[note] = channel
-                        print(f"Started playing {note}")
-                except Exception as e:
-                    print(f"Error starting {note}: {e}")
+        if note not in self.playing_notes:
+            try:
+                channel = pygame.mixer.find_channel()
+                if channel:
+                    channel.play(self.note_sounds[note], loops=-1)
+                    self.playing_notes[note] = channel
+                    print(f"Started playing {note}")
+            except Exception as e:
+                print(f"Error starting {note}: {e}")
     
     def stop_continuous_note(self, note):
         """Stop playing a note"""
         if not AUDIO_AVAILABLE:
             return
             
-        with self.audio_lock:
-            if note in self.playing_notes:
-                try:
-                    self.playing_notes[note].stop()
-                    del self.playing_notes[note]
-                    print(f"Stopped playing {note}")
-                except Exception as e:
-                    print(f"Error stopping {note}: {e}")
+        if note in self.playing_notes:
+            try:
+                self.playing_notes[note].stop()
+                del self.playing_notes[note]
+                print(f"Stopped playing {note}")
+            except Exception as e:
+                print(f"Error stopping {note}: {e}")
     
     def toggle_note(self, row, col, play_sound=True):
         """Toggle a note on/off"""
-        hex_data = self.hexagons[(row, col)]
-        note = hex_data['note']
-        
-        if (row, col) in self.active_notes:
-            self.active_notes.remove((row, col))
-            hex_data['active'] = False
-            hex_data['patch'].set_facecolor(hex_data['base_color'])
-            hex_data['patch'].set_alpha(0.6)
+        index = self.hex_index[(row, col)]
+        note = self.index_to_pitch_class(self.hex_pitch[index])
+        
+        if self.hex_active[index]:
+            self.hex_active[index] = False
+            self.set_hex_colors(index, self.hex_base_color[index], 0.6)
             if play_sound:
                 self.stop_continuous_note(note)
         else:
-            self.active_notes.add((row, col))
-            hex_data['active'] = True
-            hex_data['patch'].set_facecolor('white')
-            hex_data['patch'].set_alpha(1.0)
+            self.hex_active[index] = True
+            self.set_hex_colors(index, 'white', 1.0)
             if play_sound:
                 self.start_continuous_note(note)
         
-        self.fig.canvas.draw_idle()
+        self.refresh_hex_colors()
+        # Only the hexagon layer changed, so skip re-laying out the rest of the figure
+        self.blit_hexagons()
     
     def highlight_chord(self, root, quality='major'):
         """Highlight a chord and show the triangle"""
         self.clear_chord_highlights()
         
-        root_index = self.pitch_class_to_index(root)
+        chord_indices = self.chord_indices(root, quality)
         
-        if quality == 'major':
-            chord_indices = [root_index, (root_index + 4) % 12, (root_index + 7) % 12]
-        else:  # minor
-            chord_indices = [root_index, (root_index + 3) % 12, (root_index + 7) % 12]
-        
-        chord_positions = []
-        for (row, col), hex_data in self.hexagons.items():
-            if hex_data['pitch_index'] in chord_indices:
-                self.chord_highlights.add((row, col))
-                if (row, col) not in self.active_notes:
-                    hex_data['patch'].set_facecolor('yellow')
-                    hex_data['patch'].set_alpha(0.9)
-                chord_positions.append(hex_data['position'])
-        
-        if len(chord_positions) >= 3:
+        self.hex_highlighted = np.isin(self.hex_pitch, chord_indices)
+        self.set_hex_colors(self.hex_highlighted & ~self.hex_active, 'yellow', 0.9)
+        self.refresh_hex_colors()
+        
+        positions = self.hex_positions[self.hex_highlighted]
+        if len(positions) >= 3:
+            dist = np.linalg.norm(positions[:, None] - positions[None, :], axis=-1)
+            
+            # A side of 3 or more already forces a perimeter of at least 6,
+            # so only pairs closer than that can be part of the triangle we draw
+            close = dist < 3
+            
             min_perimeter = float('inf')
             best_triangle = None
             
-            for i in range(len(chord_positions)):
-                for j in range(i+1, len(chord_positions)):
-                    for k in range(j+1, len(chord_positions)):
-                        p1, p2, p3 = chord_positions[i], chord_positions[j], chord_positions[k]
-                        perimeter = (np.linalg.norm(np.array(p1) - np.array(p2)) +
-                                   np.linalg.norm(np.array(p2) - np.array(p3)) +
-                                   np.linalg.norm(np.array(p3) - np.array(p1)))
-                        if perimeter < min_perimeter:
-                            min_perimeter = perimeter
-                            best_triangle = [p1, p2, p3]
+            for i, j in zip(*np.nonzero(np.triu(close, 1))):
+                ks = j + 1 + np.nonzero(close[i, j+1:] & close[j, j+1:])[0]
+                if len(ks) == 0:
+                    continue
+                perimeters = dist[i, j] + dist[j, ks] + dist[ks, i]
+                best = np.argmin(perimeters)
+                if perimeters[best] < min_perimeter:
+                    min_perimeter = perimeters[best]
+                    best_triangle = positions[[i, j, ks[best]]]
             
-            if best_triangle and min_perimeter < 6:
+            if best_triangle is not None and min_perimeter < 6:
                 triangle = patches.Polygon(best_triangle, closed=True,
                                          facecolor='none', 
                                          edgecolor='red' if quality == 'major' else 'blue',
-                                         linewidth=3, alpha=0.8)
+                                         linewidth=3, alpha=0.8,
+                                         animated=True)
                 self.ax.add_patch(triangle)
                 self.chord_triangles.append(triangle)
         
-        chord_notes = [self.index_to_pitch_class(i) for i in chord_indices]
-        for i, note in enumerate(chord_notes):
-            threading.Timer(i * 0.2, self.play_chord_preview, args=[note]).start()
+        self.play_chord_arpeggio(root, quality)
+        
+        self.blit_hexagons()
+    
+    def chord_indices(self, root, quality='major'):
+        """Get the pitch class indices of a major or minor triad"""
+        root_index = self.pitch_class_to_index(root)
         
-        self.fig.canvas.draw()
+        if quality == 'major':
+            return [root_index, (root_index + 4) % 12, (root_index + 7) % 12]
+        else:  # minor
+            return [root_index, (root_index + 3) % 12, (root_index + 7) % 12]
     
-    def play_chord_preview(self, note):
-        """Play a brief preview of a chord note"""
+    def play_chord_arpeggio(self, root, quality='major'):
+        """Play the pre-mixed arpeggio of a chord"""
         if AUDIO_AVAILABLE:
             try:
-                note_key = f"{note}4"
-                if note_key in self.note_frequencies:
-                    frequency = self.note_frequencies[note_key]
-                    
-                    duration = 1.5
-                    sample_rate = 22050
-                    frames = int(duration * sample_rate)
-                    arr = np.zeros((frames, 2))
-                    
-                    harmonics = [(1.0, 1), (0.5, 2), (0.3, 3), (0.2, 4)]
-                    
-                    for i in range(frames):
-                        sample = 0
-                        for amp, mult in harmonics:
-                            sample += amp * np.sin(2 * np.pi * frequency * mult * i / sample_rate)
-                        sample /= len(harmonics)
-                        arr[i][0] = sample
-                        arr[i][1] = sample
-                    
-                    fade_frames = int(0.3 * sample_rate)
-                    for i in range(fade_frames):
-                        arr[-(i+1)] *= i / fade_frames
-                    
-                    arr = np.clip(arr * 15000, -32767, 32767).astype(np.int16)
-                    sound = pygame.sndarray.make_sound(arr)
-                    channel = pygame.mixer.find_channel()
-                    if channel:
-                        channel.play(sound)
+                sound = self.chord_sounds.get((root, quality))
+                channel = pygame.mixer.find_channel()
+                if sound is not None and channel:
+                    channel.play(sound)
             except Exception as e:
-                print(f"Error playing chord preview {note}: {e}")
+                print(f"Error playing chord {root} {quality}: {e}")
     
     def clear_chord_highlights(self):
         """Clear chord highlights but keep manually toggled notes"""
-        for (row, col) in self.chord_highlights:
-            if (row, col) not in self.active_notes:
-                hex_data = self.hexagons[(row, col)]
-                hex_data['patch'].set_facecolor(hex_data['base_color'])
-                hex_data['patch'].set_alpha(0.6)
+        restore = self.hex_highlighted & ~self.hex_active
+        self.set_hex_colors(restore, self.hex_base_color[restore], 0.6)
+        self.refresh_hex_colors()
         
         for triangle in self.chord_triangles:
             triangle.remove()
         
-        self.chord_highlights.clear()
+        self.hex_highlighted[:] = False
         self.chord_triangles.clear()
     
     def clear_all(self):
         """Clear all highlights and active notes"""
         self.clear_chord_highlights()
         
-        if not AUDIO_AVAILABLE:
-            return
-
-        # Acquire the lock once to stop all playing notes safely
-        with self.audio_lock:
-            # Get a list of notes to stop to avoid modifying the dict while iterating
-            notes_to_stop = list(self.playing_notes.keys()) 
-            for note in notes_to_stop:
-                try:
-                    if note in self.playing_notes: # Check again in case it was stopped by another means
-                        self.playing_notes[note].stop()
-                        del self.playing_notes[note]
-                        print(f"Stopped playing {note} during clear_all")
-                except Exception as e:
-                    print(f"Error stopping {note} during clear_all: {e}")
+        if AUDIO_AVAILABLE:
+            # Stop every channel in one call rather than one note at a time
+            try:
+                pygame.mixer.stop()
+                print("Stopped all notes")
+            except Exception as e:
+                print(f"Error stopping notes during clear_all: {e}")
+            self.playing_notes.clear()
         
         # Visually update the hexagons and clear active notes
-        for (row, col) in list(self.active_notes):
-            hex_data = self.hexagons[(row, col)]
-            hex_data['active'] = False
-            hex_data['patch'].set_facecolor(hex_data['base_color'])
-            hex_data['patch'].set_alpha(0.6)
-        
-        self.active_notes.clear()
-        # Use draw_idle() to safely schedule a redraw from an event handler
-        self.fig.canvas.draw_idle()
+        self.set_hex_colors(self.hex_active, self.hex_base_color[self.hex_active], 0.6)
+        self.refresh_hex_colors()
+        
+        self.hex_active[:] = False
+        self.blit_hexagons()
     
     def point_in_hex(self, point, hex_center, size=0.5):
         """Check if a point is inside a pointy-topped hexagon"""
@@ -545,9 +495,15 @@ class TonnetzGrid:
     
     def find_hex_at_point(self, x, y):
         """Find which hexagon contains the given point"""
-        for (row, col), hex_data in self.hexagons.items():
-            if self.point_in_hex((x, y), hex_data['position']):
-                return (row, col)
+        if len(self.hex_positions) == 0:
+            return None
+        
+        # Only the hexagon with the nearest center can contain the point
+        dist_sq = ((self.hex_positions - (x, y)) ** 2).sum(axis=1)
+        nearest = int(np.argmin(dist_sq))
+        if self.point_in_hex((x, y), self.hex_positions[nearest]):
+            row, col = self.hex_cells[nearest]
+            return (int(row), int(col))
         return None
     
     def on_press(self, event):
@@ -561,7 +517,7 @@ class TonnetzGrid:
             self.already_toggled.clear()
             self.already_toggled.add(hex_pos)
             
-            self.drag_toggle_state = hex_pos not in self.active_notes
+            self.drag_toggle_state = not self.hex_active[self.hex_index[hex_pos]]
             
             self.toggle_note(*hex_pos)
     
@@ -574,7 +530,7 @@ class TonnetzGrid:
         if hex_pos and hex_pos not in self.already_toggled:
             self.already_toggled.add(hex_pos)
             
-            is_active = hex_pos in self.active_notes
+            is_active = self.hex_active[self.hex_index[hex_pos]]
             if is_active != self.drag_toggle_state:
                 self.toggle_note(*hex_pos, play_sound=True)
     
@@ -602,6 +558,7 @@ class TonnetzGrid:
         self.fig.canvas.mpl_connect('button_release_event', self.on_release)
         self.fig.canvas.mpl_connect('motion_notify_event', self.on_motion)
         self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
         
         try:
             self.fig.canvas.manager.set_window_title('Tonnetz Grid - Musical Pitch Space')
@@ -630,7 +587,6 @@ def main():
     print("• Press C,D,E,F,G,A,B for major chords (yellow highlight)")
     print("• Press c,d,e,f,g,a,b for minor chords")
     print("• Press Space to clear all notes")
-    print("\nNOTE: Loading may take a moment while we generate audio magic! ♪")
     print("\n" + "="*60 + "\n")
     
     tonnetz = TonnetzGrid(rows=7, cols=12)